@@ -1,5 +1,22 @@
-import re
+import json
+from collections import namedtuple
 from datetime import datetime
+from operator import itemgetter
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 """Parse Riot API
 
@@ -8,10 +25,24 @@ Implementation of the following Riot API class:
     * MetadataDto
     * InfoDto
     
-Note some of the class will contain additional functionality 
+Note some of the class will contain additional functionality
 
 """
 
+# Region to route region map
+_ROUTE_REGION = {
+    'NA1': 'AMERICAS', 'BR1': 'AMERICAS', 'LA1': 'AMERICAS', 'LA2': 'AMERICAS', 'OC1': 'AMERICAS',
+    'KR': 'ASIA', 'JP1': 'ASIA',
+    'EUN1': 'EUROPE', 'EUW1': 'EUROPE', 'TR1': 'EUROPE', 'RU': 'EUROPE',
+}
+
+# One-pass partition of participants into those that gained/lost LP.
+# Each entry is a (puuid, traits, units) tuple
+_Partition = namedtuple('_Partition', ['winners', 'losers'])
+
+# Sentinel for lazily computed attributes whose value may legitimately be None
+_UNSET = object()
+
 
 class BaseDto:
     """Base Dto class
@@ -21,6 +52,8 @@ class BaseDto:
 
     """
 
+    __slots__ = ()
+
     def to_dict(self) -> dict:
         """Retrieve dictionary of match data
 
@@ -38,6 +71,8 @@ class MatchDto(BaseDto):
         info (InfoDto): InfoDto class
     """
 
+    __slots__ = ('data', 'metadata', 'info')
+
     def __init__(self, data: dict):
         """Initialzie MatchDto class
 
@@ -47,8 +82,37 @@ class MatchDto(BaseDto):
         self.data = data
         self.metadata: MetadataDto = MetadataDto(data['metadata'])
         self.info: InfoDto = InfoDto(data['info'])
-        self.patch: str = str(self.info.patch)
-        self.tft_set_number: str = str(self.info.tft_set_number)
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> 'MatchDto':
+        """Build a MatchDto straight from raw match JSON
+
+        Decodes with msgspec or orjson when installed (C-level JSON decode,
+        noticeably faster when ingesting many matches) and falls back to the
+        stdlib json module otherwise. Pass bytes where possible — the fast
+        decoders skip a UTF-8 decode that way
+
+        Args:
+            raw (bytes/str): Raw match JSON from Riot
+
+        Returns:
+            MatchDto of the decoded match
+        """
+        if msgspec is not None:
+            return cls(msgspec.json.decode(raw))
+        if orjson is not None:
+            return cls(orjson.loads(raw))
+        return cls(json.loads(raw))
+
+    @property
+    def patch(self) -> str:
+        """Match patch number, same as self.info.patch"""
+        return self.info.patch
+
+    @property
+    def tft_set_number(self) -> int:
+        """Teamfight Tactics set number, same as self.info.tft_set_number"""
+        return self.info.tft_set_number
 
     def region(self) -> str:
         """Match region
@@ -78,6 +142,8 @@ class MetadataDto(BaseDto):
         participants (list[str]): List of participants PUUIDS
     """
 
+    __slots__ = ('data', 'data_version', 'match_id', 'participants', '_region', '_route_region')
+
     def __init__(self, data: dict):
         """Initialize MetadataDto class
 
@@ -88,8 +154,22 @@ class MetadataDto(BaseDto):
         self.data_version: str = data['data_version']
         self.match_id: str = data['match_id']
         self.participants: list[str] = data['participants']
-        self.region = self.get_region()
-        self.route_region = self.get_route_region()
+        self._region = _UNSET
+        self._route_region = _UNSET
+
+    @property
+    def region(self) -> str:
+        """Match's region, parsed from match_id on first access"""
+        if self._region is _UNSET:
+            self._region = self.get_region()
+        return self._region
+
+    @property
+    def route_region(self) -> str:
+        """Match's route region, computed on first access"""
+        if self._route_region is _UNSET:
+            self._route_region = self.get_route_region()
+        return self._route_region
 
     def get_match_num(self) -> str:
         """Get match's number
@@ -97,12 +177,12 @@ class MetadataDto(BaseDto):
         Returns:
             Match number (without region)
         """
-        match_regex = re.compile(r'\_(.*?)')
-        match = re.findall(match_regex, self.match_id)
+        # Match id is of the form <region>_<match number>
+        _, sep, tail = self.match_id.partition('_')
 
         # Check if there's any match
-        if len(match) > 0:
-            return match[0]
+        if sep:
+            return tail.partition('_')[0]
         else:
             return None
 
@@ -112,13 +192,12 @@ class MetadataDto(BaseDto):
         Returns:
             Match's region as str
         """
-        # Regex match region
-        region_regex = re.compile(r'(.*?)\_')
-        region = re.findall(region_regex, self.match_id)
+        # Match id is of the form <region>_<match number>
+        head, sep, _ = self.match_id.partition('_')
 
         # Check if there's any match
-        if len(region) > 0:
-            return region[0]
+        if sep:
+            return head
         else:
             return None
 
@@ -132,16 +211,12 @@ class MetadataDto(BaseDto):
             Route region (AMERICAS/ASIA/EUROPE)
         """
         # Get region name
-        region = self.get_region().upper()
+        region = self.region.upper()
 
         # Region to route region map
-        if region in ['NA1', 'BR1', 'LA1', 'LA2', 'OC1']:
-            return 'AMERICAS'
-        elif region in ['KR', 'JP1']:
-            return 'ASIA'
-        elif region in ['EUN1', 'EUW1', 'TR1', 'RU']:
-            return 'EUROPE'
-        else:
+        try:
+            return _ROUTE_REGION[region]
+        except KeyError:
             raise ValueError(f"{region} is not defined")
 
 
@@ -157,6 +232,9 @@ class InfoDto(BaseDto):
         tft_set_number (int): Teamfight Tactics set number.
     """
 
+    __slots__ = ('data', 'game_datetime', 'game_length', 'game_version', '_participants', 'queue_id',
+                 'tft_set_number', '_patch', '_partition')
+
     def __init__(self, data: dict):
         """Initialize InfoDto class
 
@@ -167,10 +245,30 @@ class InfoDto(BaseDto):
         self.game_datetime = data['game_datetime']
         self.game_length = data['game_length']
         self.game_version = data['game_version']
-        self.participants: list[ParticipantDto] = [ParticipantDto(participant) for participant in data['participants']]
+        self._participants = None
         self.queue_id: int = data['queue_id']
         self.tft_set_number: int = data['tft_set_number']
-        self.patch = self.get_patch()
+        self._patch = _UNSET
+        self._partition = None
+
+    @property
+    def participants(self) -> list['ParticipantDto']:
+        """Participants info, built lazily on first access
+
+        Building the ParticipantDto tree (with its traits and units) is the
+        bulk of parsing a match; callers that only read scalar fields such as
+        game_datetime or queue_id never pay for it
+        """
+        if self._participants is None:
+            self._participants = [ParticipantDto(participant) for participant in self.data['participants']]
+        return self._participants
+
+    @property
+    def patch(self) -> str:
+        """Patch number, parsed from game_version on first access"""
+        if self._patch is _UNSET:
+            self._patch = self.get_patch()
+        return self._patch
 
     def get_patch(self) -> str:
         """Get patch number
@@ -179,20 +277,18 @@ class InfoDto(BaseDto):
 
         For example: `Version 11.6.365.1420 (Mar 17 2021/12:30:16) [PUBLIC]`
 
-        This function will regex and get the patch number (11.6)
+        This function will parse out the patch number (11.6)
 
         Returns:
               Patch number as str
         """
-        # Regex search patch version
-        patch_regex = re.compile(r'Version (.*?\..*?)\.')
-        patch = re.findall(patch_regex, self.game_version)
-
-        # Chek if there's any match
-        if len(patch) > 0:
-            return str(patch[0])
-        else:
-            print(f"Unable to regex match patch, game_version: {self.game_version}")
+        # Patch is the first two dot fields of the 2nd whitespace-delimited token
+        try:
+            version = self.game_version.split(' ', 2)[1]  # "11.6.365.1420"
+            major, minor, _ = version.split('.', 2)
+            return f"{major}.{minor}"
+        except (IndexError, ValueError):
+            print(f"Unable to parse patch, game_version: {self.game_version}")
             return None
 
     def get_game_datetime(self) -> datetime:
@@ -201,7 +297,28 @@ class InfoDto(BaseDto):
 
     def is_rank(self) -> bool:
         """Is match ranked"""
-        return True if int(self.queue_id) == 1100 else False
+        return self.queue_id == 1100
+
+    def _partitioned(self) -> _Partition:
+        """Split participants into winners and losers in a single pass
+
+        The win_*/lose_* methods all iterate participants and re-test
+        gained_lp(); doing the scan once and caching the result means callers
+        that want several of them only pay for one pass
+
+        Returns:
+            _Partition with .winners/.losers lists of (puuid, traits, units)
+        """
+        if self._partition is None:
+            winners, losers = [], []
+            for participant in self.participants:
+                entry = (participant.puuid, participant.traits_used(), participant.units)
+                if participant.gained_lp_bool:
+                    winners.append(entry)
+                else:
+                    losers.append(entry)
+            self._partition = _Partition(winners, losers)
+        return self._partition
 
     def win_players(self) -> list[str]:
         """Puuid that gained LP
@@ -209,7 +326,7 @@ class InfoDto(BaseDto):
         Returns:
             List of puuid that is top 4
         """
-        return [participant.puuid for participant in self.participants if participant.gained_lp()]
+        return list(map(itemgetter(0), self._partitioned().winners))
 
     def lose_players(self):
         """Puuid that lost LP
@@ -217,7 +334,7 @@ class InfoDto(BaseDto):
         Returns:
             List of puuid that is bottom 4
          """
-        return [participant.puuid for participant in self.participants if not participant.gained_lp()]
+        return list(map(itemgetter(0), self._partitioned().losers))
 
     def win_traits(self) -> list[list]:
         """Winning player's trait list
@@ -225,7 +342,7 @@ class InfoDto(BaseDto):
         Returns:
             List of traits for those that gained LP
         """
-        return [participant.traits_used() for participant in self.participants if participant.gained_lp()]
+        return list(map(itemgetter(1), self._partitioned().winners))
 
     def lose_traits(self) -> list[list]:
         """Winning player's trait list
@@ -233,7 +350,7 @@ class InfoDto(BaseDto):
         Returns:
             List of traits for those that lost LP
         """
-        return [participant.traits_used() for participant in self.participants if not participant.gained_lp()]
+        return list(map(itemgetter(1), self._partitioned().losers))
 
     def win_units(self) -> list:
         """Winning player's units
@@ -241,7 +358,7 @@ class InfoDto(BaseDto):
         Returns:
             List of units (UnitDto) from players that gained LP
         """
-        return [participant.units for participant in self.participants if participant.gained_lp()]
+        return list(map(itemgetter(2), self._partitioned().winners))
 
     def lose_units(self) -> list:
         """Winning player's units
@@ -249,7 +366,7 @@ class InfoDto(BaseDto):
         Returns:
             List of units (UnitDto) from players that lost LP
         """
-        return [participant.units for participant in self.participants if not participant.gained_lp()]
+        return list(map(itemgetter(2), self._partitioned().losers))
 
     def placements(self) -> dict:
         """Placement for each player
@@ -276,6 +393,27 @@ class InfoDto(BaseDto):
 
         return output
 
+    def placement_array(self):
+        """Participant info as a NumPy structured array
+
+        Column-oriented version of placement_info() for analytical workloads
+        over many matches: stack the arrays and aggregate with vectorized
+        NumPy ops (e.g. arr['damage'].mean()) instead of looping over dicts.
+
+        Requires numpy to be installed
+
+        Returns:
+            Structured array with placement/level/last_round/gold_left/damage/time columns
+        """
+        if np is None:
+            raise ImportError("numpy is required for placement_array")
+
+        dtype = [('placement', 'i2'), ('level', 'i2'), ('last_round', 'i2'),
+                 ('gold_left', 'i4'), ('damage', 'i4'), ('time', 'f4')]
+        rows = ((part.placement, part.level, part.last_round, part.gold_left,
+                 part.total_damage_to_players, part.time_eliminated) for part in self.participants)
+        return np.fromiter(rows, dtype=dtype, count=len(self.participants))
+
 
 class ParticipantDto(BaseDto):
     """ParticipantDto
@@ -295,6 +433,9 @@ class ParticipantDto(BaseDto):
         units (list[UnitDto]): A list of units for the participant.
     """
 
+    __slots__ = ('data', 'companion', 'gold_left', 'last_round', 'level', 'placement', 'players_eliminated',
+                 'puuid', 'time_eliminated', 'total_damage_to_players', '_traits', '_units', 'gained_lp_bool')
+
     def __init__(self, data: dict):
         """Initialize ParticipantDto
 
@@ -311,8 +452,23 @@ class ParticipantDto(BaseDto):
         self.puuid: str = data["puuid"]
         self.time_eliminated: float = data["time_eliminated"]
         self.total_damage_to_players: int = data["total_damage_to_players"]
-        self.traits: list[TraitDto] = [TraitDto(trait) for trait in data['traits']]
-        self.units: list[UnitDto] = [UnitDto(unit) for unit in data['units']]
+        self._traits = None
+        self._units = None
+        self.gained_lp_bool: bool = self.placement <= 4
+
+    @property
+    def traits(self) -> list['TraitDto']:
+        """Participant's traits, built lazily on first access"""
+        if self._traits is None:
+            self._traits = [TraitDto(trait) for trait in self.data['traits']]
+        return self._traits
+
+    @property
+    def units(self) -> list['UnitDto']:
+        """Participant's units, built lazily on first access"""
+        if self._units is None:
+            self._units = [UnitDto(unit) for unit in self.data['units']]
+        return self._units
 
     def traits_used(self) -> list:
         """Get list of trait played in game
@@ -330,7 +486,7 @@ class ParticipantDto(BaseDto):
 
     def gained_lp(self) -> bool:
         """Did the player gain LP (placement 1-4)"""
-        return True if self.placement <= 4 else False
+        return self.gained_lp_bool
 
 
 class TraitDto(BaseDto):
@@ -344,6 +500,8 @@ class TraitDto(BaseDto):
         tier_total (int): Total tiers for the trait.
     """
 
+    __slots__ = ('data', 'name', 'num_units', 'style', 'tier_current', 'tier_total')
+
     def __init__(self, data: dict):
         self.data = data
         self.name = data['name']
@@ -373,8 +531,9 @@ class UnitDto(BaseDto):
     """Implementation of UnitDto
 
     Attributes:
-        items (list[int]): A list of the unit's items. Please refer to the Teamfight Tactics documentation for item ids.
+        items (tuple[int]): The unit's items, sorted. Please refer to the Teamfight Tactics documentation for item ids.
         character_id (string): This field was introduced in patch 9.22 with data_version 2.
+        champion_name (string): Alias of character_id, used by the aggregation classes.
         chosen (string): If a unit is chosen as part of the Fates set mechanic, the chosen trait will be indicated by 
             this field. Otherwise this field is excluded from the response.
         name (string): Unit name. This field is often left blank.
@@ -386,10 +545,15 @@ class UnitDto(BaseDto):
         * Tier: Unit's star level
     """
 
+    __slots__ = ('items', 'items_tuple', 'character_id', 'champion_name', 'chosen', 'rarity', 'unit_cost',
+                 'tier')
+
     def __init__(self, data: dict):
-        self.items: list[int] = sorted(data['items'])
+        self.items: tuple = tuple(sorted(data['items']))
+        self.items_tuple: tuple = self.items
         self.character_id: str = data['character_id']
-        self.chosen: str = data['chosen'] if 'chosen' in data.keys() else ""
+        self.champion_name: str = self.character_id
+        self.chosen: str = data.get('chosen', "")
         self.rarity: int = int(data['rarity'])
         self.unit_cost: int = int(self.rarity + 1)
         self.tier: int = int(data['tier'])
@@ -400,7 +564,7 @@ class UnitDto(BaseDto):
         Returns:
               True if unit is chosen (self.chosen is not empty)
         """
-        return True if self.chosen != "" else False
+        return self.chosen != ""
 
     def star_level(self) -> int:
         """Unit's star level
@@ -408,14 +572,13 @@ class UnitDto(BaseDto):
         Returns:
             unit's star level. This is the same as self.tier
         """
-        return int(self.tier)
+        return self.tier
 
 
 if __name__ == '__main__':
     from pprint import pprint
-    import json
 
-    with open('../docs/source/match.json', 'r') as f:
-        data = json.load(f)
+    with open('../docs/source/match.json', 'rb') as f:
+        match = MatchDto.from_json(f.read())
 
-    pprint(MatchDto(data).info.__dict__)
\ No newline at end of file
+    pprint(match.info.to_dict())
\ No newline at end of file
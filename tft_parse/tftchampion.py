@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from .api import UnitDto
 from typing import Union
 
@@ -35,23 +37,23 @@ class TFTChampion:
         self.item_comb3: dict = None
         self.tier_dist: dict = None
 
-    def initalize(self) -> None:
+    def initialize(self) -> None:
         """Create brand new class
 
         Class is not initialized initially to prevent writing to brand new class when user is expecting to write to
         existing class
         """
         self.occurrence: int = 0
-        self.chosen_dist: dict = {}
-        self.item: dict = {}
-        self.item_1: dict = {}
-        self.item_2: dict = {}
-        self.item_3: dict = {}
-        self.item_comb: dict = {}
-        self.item_comb1: dict = {}
-        self.item_comb2: dict = {}
-        self.item_comb3: dict = {}
-        self.tier_dist: dict = {}
+        self.chosen_dist: dict = defaultdict(int)
+        self.item: dict = defaultdict(int)
+        self.item_1: dict = defaultdict(int)
+        self.item_2: dict = defaultdict(int)
+        self.item_3: dict = defaultdict(int)
+        self.item_comb: dict = defaultdict(int)
+        self.item_comb1: dict = defaultdict(int)
+        self.item_comb2: dict = defaultdict(int)
+        self.item_comb3: dict = defaultdict(int)
+        self.tier_dist: dict = defaultdict(int)
 
     def from_dict(self, data: dict) -> None:
         """Initialize class from a json object (e.g. from Firestore)
@@ -61,16 +63,16 @@ class TFTChampion:
         """
         self.champion_name = data['champion_name']
         self.occurrence = data['occurrence']
-        self.chosen_dist = data['chosen_dist']
-        self.item = data['item']
-        self.item_1 = data['item_1']
-        self.item_2 = data['item_2']
-        self.item_3 = data['item_3']
-        self.item_comb = data['item_comb']
-        self.item_comb1 = data['item_comb1']
-        self.item_comb2 = data['item_comb2']
-        self.item_comb3 = data['item_comb3']
-        self.tier_dist = data['tier_dist']
+        self.chosen_dist = defaultdict(int, data['chosen_dist'])
+        self.item = defaultdict(int, data['item'])
+        self.item_1 = defaultdict(int, data['item_1'])
+        self.item_2 = defaultdict(int, data['item_2'])
+        self.item_3 = defaultdict(int, data['item_3'])
+        self.item_comb = defaultdict(int, data['item_comb'])
+        self.item_comb1 = defaultdict(int, data['item_comb1'])
+        self.item_comb2 = defaultdict(int, data['item_comb2'])
+        self.item_comb3 = defaultdict(int, data['item_comb3'])
+        self.tier_dist = defaultdict(int, data['tier_dist'])
 
     def to_dict(self):
         """Convert class to dict object"""
@@ -113,62 +115,67 @@ class TFTChampion:
             raise ValueError(f"Incorrect champion_name. Class is '{self.champion_name}' and "
                              f"input data is {data.champion_name}")
 
-        # ==== Parse data ==== #
+        self._count_unit(data)
+
+    def add_units(self, units) -> None:
+        """Add many units in one call
+
+        Bulk counterpart of add_unit for aggregation jobs that feed a whole
+        season of matches through one class. The sanity checks run once per
+        batch instead of once per unit, which is most of add_unit's overhead
+        in a tight loop
+
+        Args:
+            units: Iterable of units (UnitDto/dict) to be added to class
+        """
+        # ==== Sanity Check ==== #
+        # Check if class has been initialized yet
+        if self.item is None:
+            raise ValueError(f"TFTChampion class '{self.champion_name}' has not been initialized")
+
+        count_unit = self._count_unit
+        for data in units:
+            # Convert UnitDto to class
+            if isinstance(data, dict):
+                data = UnitDto(data)
+
+            # Check if class's champion_name is same as incoming data's champion_name
+            if self.champion_name != data.champion_name:
+                raise ValueError(f"Incorrect champion_name. Class is '{self.champion_name}' and "
+                                 f"input data is {data.champion_name}")
+
+            count_unit(data)
+
+    def _count_unit(self, data: UnitDto) -> None:
+        """Update all distributions with a single (validated) unit
+
+        Args:
+            data (UnitDto): Data for unit to be added to class
+        """
         # ---- Chosen ---- #
         if data.is_chosen():
-            # If chosen is never in dict then initialize
-            if data.chosen not in self.chosen_dist.keys():
-                self.chosen_dist[data.chosen] = 1
-            else:
-                # Self increment by 1
-                self.chosen_dist[data.chosen] += 1
+            self.chosen_dist[data.chosen] += 1
 
         # ---- Item ---- #
-        # need to sort data first because the key for item_comb is a sorted list as str
+        # Select the star bin once per unit; only the unit's own star level
+        # and the overall dicts get updated
+        if 1 <= data.tier <= 3:
+            item_star = (self.item_1, self.item_2, self.item_3)[data.tier - 1]
+            comb_star = (self.item_comb1, self.item_comb2, self.item_comb3)[data.tier - 1]
+        else:
+            item_star = None
+            comb_star = None
 
-        items = sorted(data.items)
+        # data.items is a sorted tuple, built once by UnitDto.__init__
         # Individual items
-        for item in items:
+        for item in data.items:
             item = str(item)
-            # Item
-            if item not in self.item:
-                self.item[item] = 1
-            else:
-                self.item[item] += 1
-            # 1 star level
-            if item not in self.item_1.keys():
-                self.item_1[item] = 1
-            else:
-                self.item_1[item] += 1
-            # 2 stars level
-            if item not in self.item_2.keys():
-                self.item_2[item] = 1
-            else:
-                self.item_2[item] += 1
-            # 3 stars level
-            if item not in self.item_3.keys():
-                self.item_3[item] = 1
-            else:
-                self.item_3[item] += 1
+            self.item[item] += 1
+            if item_star is not None:
+                item_star[item] += 1
 
         # Item Combination
-        items = str(items)
-        if items not in self.item_comb:
-            self.item[item] = 1
-        else:
-            self.item[item] += 1
-        # 1 star level
-        if items not in self.item_comb1.keys():
-            self.item_comb1[item] = 1
-        else:
-            self.item_comb1[item] += 1
-        # 2 stars level
-        if items not in self.item_comb2.keys():
-            self.item_comb2[item] = 1
-        else:
-            self.item_comb2[item] += 1
-        # 3 stars level
-        if items not in self.item_comb3.keys():
-            self.item_comb3[item] = 1
-        else:
-            self.item_comb3[item] += 1
+        items_key = data.items
+        self.item_comb[items_key] += 1
+        if comb_star is not None:
+            comb_star[items_key] += 1
@@ -1,4 +1,6 @@
+from collections import defaultdict
 from typing import Union
+
 from .api import UnitDto
 
 
@@ -24,9 +26,9 @@ class TFTItem:
         Class is not initialized initially to prevent writing to brand new class when user is expecting to write to
         existing class
         """
-        self.champion = {}
-        self.combination = {}
-        self.other_item = {}
+        self.champion = defaultdict(int)
+        self.combination = defaultdict(int)
+        self.other_item = defaultdict(int)
 
     def from_dict(self, data: dict) -> None:
         """Initialize class from a json object (e.g. from Firestore)
@@ -58,9 +60,9 @@ class TFTItem:
             data: Data for item to be added to class
         """
         # ==== Sanity Check ==== #
-        # If dat ais dict then convert to UnitDto
+        # If data is dict then convert to UnitDto
         if isinstance(data, dict):
-            data = UnitDto
+            data = UnitDto(data)
 
         # Check if class has been initialized yet
         if self.champion is None:
@@ -68,24 +70,16 @@ class TFTItem:
 
         # ==== Parse data ==== #
         # ---- Champion ---- #
-        if data.champion_name not in self.champion.keys():
-            self.champion[data.champion_name] = 1
-        else:
-            self.champion[data.champion_name] += 1
+        self.champion[data.champion_name] += 1
 
         # ---- Item combination ---- #
+        # Drop first occurrence of item_id by slicing the immutable tuple.
+        # Duplicated item stays in the key
         items = data.items
-        # Remove first occurrence of item_id. This allows duplicated item to still in list
-        items.remove(self.item_id)
-        items_comb = str(items)
-        if items_comb not in self.combination.keys():
-            self.combination[items_comb] = 1
-        else:
-            self.combination[items_comb] += 1
+        index = items.index(self.item_id)
+        items = items[:index] + items[index + 1:]
+        self.combination[items] += 1
 
         # ---- Other Item ---- #
         for item in items:
-            if item not in self.other_item.keys():
-                self.other_item[item] = 1
-            else:
-                self.other_item[item] += 1
+            self.other_item[item] += 1